@@ -1,10 +1,88 @@
-from typing import Optional, Tuple
+from collections.abc import Iterator, Sequence
+from functools import cache
+from itertools import islice
+from typing import Optional, Tuple, overload
 
 from checkers_bot_tournament.board_start_builder import BoardStartBuilder
 from checkers_bot_tournament.move import Move
 from checkers_bot_tournament.piece import Colour, Piece
 
 Grid = list[list[Optional[Piece]]]
+Position = Tuple[int, int]
+Direction = Tuple[int, int]
+# Per square: for each direction that stays on the board, the next square along it
+# and the landing square of a jump along it (None if the jump falls off the board)
+SquareTargets = list[list[list[Tuple[Position, Optional[Position]]]]]
+
+WHITE_DIRECTIONS: Tuple[Direction, ...] = ((-1, -1), (-1, 1))
+BLACK_DIRECTIONS: Tuple[Direction, ...] = ((1, -1), (1, 1))
+# Kings can move in all four diagonals, forwards first to keep move order stable
+WHITE_KING_DIRECTIONS: Tuple[Direction, ...] = WHITE_DIRECTIONS + ((1, 1), (1, -1))
+BLACK_KING_DIRECTIONS: Tuple[Direction, ...] = BLACK_DIRECTIONS + ((-1, 1), (-1, -1))
+
+
+@cache
+def _square_targets(size: int, directions: Tuple[Direction, ...]) -> SquareTargets:
+    """
+    Precomputes the squares reachable in each direction from every square, so
+    move generation doesn't have to redo the arithmetic and bounds checks each time.
+    """
+
+    def square_or_none(row: int, col: int) -> Optional[Position]:
+        return (row, col) if 0 <= row < size and 0 <= col < size else None
+
+    table: SquareTargets = [[[] for _ in range(size)] for _ in range(size)]
+    for row in range(size):
+        for col in range(size):
+            for dr, dc in directions:
+                step = square_or_none(row + dr, col + dc)
+                if step is not None:
+                    table[row][col].append((step, square_or_none(row + 2 * dr, col + 2 * dc)))
+    return table
+
+
+class MoveHistory(Sequence[Move]):
+    """
+    Read-only view of the first length moves of a (possibly shared) history list.
+    Creating one is O(1), so bots can look at the history every ply without the
+    whole list being copied each time.
+    """
+
+    __slots__ = ("_moves", "_length")
+
+    def __init__(self, moves: list[Move], length: int) -> None:
+        # Moves are only ever appended to the list, so the ones we can see never change
+        self._moves = moves
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Move: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Tuple[Move, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> Move | Tuple[Move, ...]:
+        if isinstance(index, slice):
+            return tuple(self._moves[i] for i in range(self._length)[index])
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("move history index out of range")
+        return self._moves[index]
+
+    def __iter__(self) -> Iterator[Move]:
+        return islice(self._moves, self._length)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(other) == self._length and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"MoveHistory({list(self)!r})"
 
 
 class Board:
@@ -15,7 +93,38 @@ class Board:
 
         self.grid: Grid = board_start_builder.build()
 
-        self.move_history: list[Move] = []
+        # The history list is append-only, so clones share it instead of copying it.
+        # A board only sees the first _history_len moves of a shared list and takes
+        # its own copy before recording a move of its own.
+        self._move_history: list[Move] = []
+        self._history_len = 0
+        self._owns_history = True
+
+        # Move lists for the current position, cleared whenever a piece moves. Stored as
+        # tuples so they can be shared with clones without callers being able to change them
+        self._move_cache: dict[Colour, Optional[Tuple[Move, ...]]] = {
+            Colour.WHITE: None,
+            Colour.BLACK: None,
+        }
+
+    def clone(self) -> "Board":
+        """
+        Returns an independent copy of the board, much cheaper than copy.deepcopy.
+
+        Pieces are mutable (position, is_king) so they are copied, the move history
+        is shared until either board makes another move.
+        """
+        new = Board.__new__(Board)
+        new.size = self.size
+        new.grid = [
+            [Piece(piece.position, piece.colour, piece.is_king) if piece else None for piece in row]
+            for row in self.grid
+        ]
+        new._move_history = self._move_history
+        new._history_len = self._history_len
+        new._owns_history = False
+        new._move_cache = self._move_cache.copy()
+        return new
 
     def move_piece(self, move: Move) -> Tuple[bool, bool]:
         """
@@ -35,7 +144,13 @@ class Board:
         piece.position = move.end
 
         # Add move to move_history
-        self.move_history.append(move)
+        if not self._owns_history:
+            self._move_history = self._move_history[: self._history_len]
+            self._owns_history = True
+        self._move_history.append(move)
+        self._history_len += 1
+        self._move_cache[Colour.WHITE] = None
+        self._move_cache[Colour.BLACK] = None
 
         capture = False
         promotion = False
@@ -47,70 +162,64 @@ class Board:
 
         # Promote to king
         if (not piece.is_king) and (
-            (piece.colour == Colour.WHITE and end_row == 0)
-            or (piece.colour == Colour.BLACK and end_row == self.size - 1)
+            (piece.colour is Colour.WHITE and end_row == 0)
+            or (piece.colour is Colour.BLACK and end_row == self.size - 1)
         ):
             piece.is_king = True
             promotion = True
 
         return (capture, promotion)
 
-    def add_regular_move(self, moves: list[Move], row: int, col: int, dr: int, dc: int):
-        end_row, end_col = row + dr, col + dc
-        if self.is_within_bounds(end_row, end_col) and self.grid[end_row][end_col] is None:
-            moves.append(Move((row, col), (end_row, end_col), None))
-
-    def add_capture_move(
-        self, moves: list[Move], colour: Colour, row: int, col: int, dr: int, dc: int
-    ):
-        capture_row, capture_col = row + 2 * dr, col + 2 * dc
-        if not self.is_within_bounds(capture_row, capture_col):
-            return
-
-        mid_row, mid_col = row + dr, col + dc
-        mid_piece: Optional[Piece] = self.grid[mid_row][mid_col]
-        valid_capture_move = (
-            self.grid[capture_row][capture_col] is None
-            and mid_piece is not None
-            and mid_piece.colour != colour
-        )
-
-        if valid_capture_move:
-            moves.append(
-                Move(
-                    (row, col),
-                    (capture_row, capture_col),
-                    (mid_row, mid_col),
-                )
-            )
-
     def is_valid_move(self, colour: Colour, move: Move) -> bool:
         return move in self.get_move_list(colour)
 
     def get_move_list(self, colour: Colour) -> list[Move]:
-        moves: list[Move] = []
+        """
+        Returns the legal moves for colour in the current position.
+
+        Generation is cached until the next move_piece, every call gets its own list.
+        """
+        cached = self._move_cache[colour]
+        if cached is None:
+            cached = tuple(self._generate_move_list(colour))
+            self._move_cache[colour] = cached
+        return list(cached)
+
+    def _generate_move_list(self, colour: Colour) -> list[Move]:
+        grid = self.grid
 
-        # Directions for normal pieces
-        forward_directions = [(-1, -1), (-1, 1)] if colour == Colour.WHITE else [(1, -1), (1, 1)]
-        # Directions for kings (can move in all four diagonals)
-        king_directions = forward_directions + [(-d[0], -d[1]) for d in forward_directions]
+        # Normal pieces only move forwards
+        if colour is Colour.WHITE:
+            forward_targets = _square_targets(self.size, WHITE_DIRECTIONS)
+            king_targets = _square_targets(self.size, WHITE_KING_DIRECTIONS)
+        else:
+            forward_targets = _square_targets(self.size, BLACK_DIRECTIONS)
+            king_targets = _square_targets(self.size, BLACK_KING_DIRECTIONS)
 
+        moves: list[Move] = []
+        capture_moves: list[Move] = []
         for row in range(self.size):
+            cells = grid[row]
             for col in range(self.size):
-                piece = self.get_piece((row, col))
-                if piece and piece.colour == colour:
-                    directions = king_directions if piece.is_king else forward_directions
+                piece = cells[col]
+                if piece is None or piece.colour is not colour:
+                    continue
 
-                    for dr, dc in directions:
-                        self.add_regular_move(moves, row, col, dr, dc)
-                        self.add_capture_move(moves, colour, row, col, dr, dc)
+                targets = king_targets if piece.is_king else forward_targets
+                for step, jump in targets[row][col]:
+                    step_piece = grid[step[0]][step[1]]
+                    if step_piece is None:
+                        moves.append(Move((row, col), step, None))
+                    elif (
+                        jump is not None
+                        and step_piece.colour is not colour
+                        and grid[jump[0]][jump[1]] is None
+                    ):
+                        capture_moves.append(Move((row, col), jump, step))
 
         # Funny rule in checkers, if there is a capture move available, you MUST
-        # take it, so here, if there are any capture moves, we filter to only
-        # allow captures moves.
-        capture_move_available = any([move.removed for move in moves])
-        if capture_move_available:
-            capture_moves = list(filter(lambda move: move.removed is not None, moves))
+        # take it, so here, if there are any capture moves, we only allow those.
+        if capture_moves:
             return capture_moves
 
         # If no capture moves available, return all moves
@@ -124,7 +233,13 @@ class Board:
         row, col = position
         return self.grid[row][col] if 0 <= row < self.size and 0 <= col < self.size else None
 
-    def get_move_history(self) -> list[Move]:
+    @property
+    def move_history(self) -> MoveHistory:
+        # A read-only view, the underlying list may be shared with other boards
+        # and can hold moves they made after we were cloned
+        return MoveHistory(self._move_history, self._history_len)
+
+    def get_move_history(self) -> MoveHistory:
         return self.move_history
 
     def display_cell(self, cell: Optional[Piece], x: int, y: int) -> str:
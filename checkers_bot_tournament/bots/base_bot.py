@@ -21,5 +21,18 @@ class Bot(ABC):
         """
         raise RuntimeError("play_move not implemented!")
 
+    def reset(self) -> None:
+        """
+        Called at the start of every game the bot plays, override this to clear any
+        per-game state.
+
+        With --parallelism 1 a single bot instance plays every game of the
+        tournament, so state not cleared here (e.g. caches) carries over between
+        games. With more workers each game is played in a worker process on its own
+        copy of the bot as it was when the tournament started, so nothing is kept
+        across games or sent back to the controller.
+        """
+        pass
+
     def get_name(self) -> str:
         raise RuntimeError("get_name not implemented yet!")
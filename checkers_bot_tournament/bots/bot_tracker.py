@@ -14,7 +14,7 @@ class EloConfig:
     SCALE = 400.0
 
 
-@dataclass
+@dataclass(slots=True)
 class GameResultStat:
     white_wins: int = 0
     white_draws: int = 0
@@ -41,9 +41,16 @@ class GameResultStat:
         return self.total_wins + self.total_draws + self.total_losses
 
 
+WHITE_SCORE_LOOKUP = {Result.WHITE: 1.0, Result.BLACK: 0.0, Result.DRAW: 0.5}
+
+
 class BotTracker:
     def __init__(self, bot: Bot, unique_bot_names: list[str]) -> None:
+        from checkers_bot_tournament.checkers_util import make_unique_bot_string
+
         self.bot = bot
+        # Bot ids and names don't change, so only build this once
+        self.unique_name = make_unique_bot_string(bot)
         self.rating: float = EloConfig.STARTING_ELO
         self.stats = GameResultStat()
         self.h2h_stats: dict[str, GameResultStat] = {
@@ -70,52 +77,49 @@ class BotTracker:
         self.tournament_scores.append(score)
 
     def register_game_result(self, game_result: GameResult):
-        from checkers_bot_tournament.checkers_util import make_unique_bot_string
-
-        unique_name = make_unique_bot_string(self.bot)
-        white_score_lookup = {Result.WHITE: 1, Result.BLACK: 0, Result.DRAW: 0.5}
-
-        match unique_name:
+        match self.unique_name:
             case game_result.white_name:
                 # Bot is playing as White
-                self._register_result(white_score_lookup[game_result.result])
-                if game_result.result == Result.WHITE:
+                self._register_result(WHITE_SCORE_LOOKUP[game_result.result])
+                h2h = self.h2h_stats[game_result.black_name]
+                if game_result.result is Result.WHITE:
                     # Bot won as White
                     self.stats.white_wins += 1
-                    self.h2h_stats[game_result.black_name].white_wins += 1
-                elif game_result.result == Result.BLACK:
+                    h2h.white_wins += 1
+                elif game_result.result is Result.BLACK:
                     # Bot lost as White
                     self.stats.white_losses += 1
-                    self.h2h_stats[game_result.black_name].white_losses += 1
-                elif game_result.result == Result.DRAW:
+                    h2h.white_losses += 1
+                elif game_result.result is Result.DRAW:
                     # Bot drew as White
                     self.stats.white_draws += 1
-                    self.h2h_stats[game_result.black_name].white_draws += 1
+                    h2h.white_draws += 1
                 else:
                     raise ValueError(f"Unknown game result: {game_result.result}")
 
             case game_result.black_name:
                 # Bot is playing as Black
-                self._register_result(1 - white_score_lookup[game_result.result])
-                if game_result.result == Result.BLACK:
+                self._register_result(1 - WHITE_SCORE_LOOKUP[game_result.result])
+                h2h = self.h2h_stats[game_result.white_name]
+                if game_result.result is Result.BLACK:
                     # Bot won as Black
                     self.stats.black_wins += 1
-                    self.h2h_stats[game_result.white_name].black_wins += 1
-                elif game_result.result == Result.WHITE:
+                    h2h.black_wins += 1
+                elif game_result.result is Result.WHITE:
                     # Bot lost as Black
                     self.stats.black_losses += 1
-                    self.h2h_stats[game_result.white_name].black_losses += 1
-                elif game_result.result == Result.DRAW:
+                    h2h.black_losses += 1
+                elif game_result.result is Result.DRAW:
                     # Bot drew as Black
                     self.stats.black_draws += 1
-                    self.h2h_stats[game_result.white_name].black_draws += 1
+                    h2h.black_draws += 1
                 else:
                     raise ValueError(f"Unknown game result: {game_result.result}")
 
             case _:
                 # Bot's unique name does not match either player in the game result
                 raise ValueError(
-                    f"Unknown bot name {unique_name} does not match "
+                    f"Unknown bot name {self.unique_name} does not match "
                     f"{game_result.white_name=} or {game_result.black_name=}"
                 )
 
@@ -1,5 +1,3 @@
-import copy
-
 from checkers_bot_tournament.board import Board
 from checkers_bot_tournament.bots.base_bot import Bot
 from checkers_bot_tournament.move import Move
@@ -18,13 +16,18 @@ class GreedyCat(Bot):
         self.man_value = 1
         self.king_value = 4
 
+    def reset(self) -> None:
+        # do_scoring adds to / subtracts from king_value in place
+        self.ply = 1
+        self.king_value = 4
+
     def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
         # print(f"Ply {self.ply if colour == Colour.WHITE else self.ply + 1} as {colour}")
         opp_colour = Colour.BLACK if colour == Colour.WHITE else Colour.WHITE
 
         scores1: list[tuple[int, int]] = []
         for i1, move1 in enumerate(move_list):
-            searchboard = copy.deepcopy(board)
+            searchboard = board.clone()
             searchboard.move_piece(move1)  # Our candidate move, now opp's turn
             move_list_2 = searchboard.get_move_list(opp_colour)
 
@@ -34,7 +37,7 @@ class GreedyCat(Bot):
 
             scores2: list[tuple[int, int]] = []
             for i2, move2 in enumerate(move_list_2):
-                searchboard2 = copy.deepcopy(searchboard)
+                searchboard2 = searchboard.clone()
                 # Opp's candidate move, now our turn
                 searchboard2.move_piece(move2)
 
@@ -69,7 +72,7 @@ class GreedyCat(Bot):
             scores: list[tuple[int, int]] = []
             if move_list[0].removed:
                 for i, move in enumerate(move_list):
-                    search_board = copy.deepcopy(board)
+                    search_board = board.clone()
                     search_board.move_piece(move)
                     score = evaluate_at_point_of_no_captures(
                         search_board, colour_to_move.get_opposite()
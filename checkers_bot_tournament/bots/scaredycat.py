@@ -1,5 +1,3 @@
-import copy
-
 from checkers_bot_tournament.board import Board
 from checkers_bot_tournament.bots.base_bot import Bot
 from checkers_bot_tournament.move import Move
@@ -16,7 +14,7 @@ class ScaredyCat(Bot):
 
         scores1: list[tuple[int, int]] = []
         for i1, move1 in enumerate(move_list):
-            searchboard = copy.deepcopy(board)
+            searchboard = board.clone()
             searchboard.move_piece(move1)  # Our candidate move, now opp's turn
             move_list_2 = searchboard.get_move_list(opp_colour)
 
@@ -1,4 +1,4 @@
-from math import inf, log10
+from math import inf, log10, sqrt
 from typing import overload
 
 from checkers_bot_tournament.bots.base_bot import Bot
@@ -80,3 +80,31 @@ def compute_performance_rating(w: int, d: int, l: int, bot_rating: float, opp_ra
     perf_rating = opp_rating + D
     diff = perf_rating - bot_rating
     return perf_rating, diff
+
+
+def compute_elo_interval(w: int, d: int, l: int, z: float = 1.96) -> tuple[float, float]:
+    """
+    Confidence interval of the Elo difference implied by w/d/l against one opponent.
+
+    Uses the Wilson score interval on the score fraction p = (w + 0.5 * d) / n
+    (draws counting as half a win), then maps both ends through the Elo formula
+    D = -400 * log10((1/p) - 1), clamped to +/- 2*scale like the performance rating.
+    """
+    total = w + d + l
+    if total == 0:
+        return -2 * EloConfig.SCALE, 2 * EloConfig.SCALE
+
+    p = (w + 0.5 * d) / total
+    denominator = 1 + z**2 / total
+    centre = (p + z**2 / (2 * total)) / denominator
+    margin = z * sqrt(p * (1 - p) / total + z**2 / (4 * total**2)) / denominator
+
+    def to_elo(score: float) -> float:
+        if score <= 0:
+            return -2 * EloConfig.SCALE
+        if score >= 1:
+            return 2 * EloConfig.SCALE
+        D = -EloConfig.SCALE * log10((1.0 / score) - 1.0)
+        return max(-2 * EloConfig.SCALE, min(2 * EloConfig.SCALE, D))
+
+    return to_elo(centre - margin), to_elo(centre + margin)
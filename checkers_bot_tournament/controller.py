@@ -1,7 +1,11 @@
+import copy
+import io
 import os
-from dataclasses import dataclass
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import IO, Dict, Optional, Type
+from itertools import combinations
+from typing import Dict, Optional, Type
 
 from checkers_bot_tournament.board import Board
 from checkers_bot_tournament.board_start_builder import (
@@ -18,24 +22,46 @@ from checkers_bot_tournament.bots.first_mover import FirstMover
 from checkers_bot_tournament.bots.greedycat import GreedyCat
 from checkers_bot_tournament.bots.random_bot import RandomBot
 from checkers_bot_tournament.bots.scaredycat import ScaredyCat
-from checkers_bot_tournament.checkers_util import make_unique_bot_string
+from checkers_bot_tournament.checkers_util import compute_elo_interval, make_unique_bot_string
 from checkers_bot_tournament.game import Game
 from checkers_bot_tournament.game_result import GameResult
 from checkers_bot_tournament.stat_printing import (
+    write_early_stopped_pairings,
     write_tournament_h2h_stats,
     write_tournament_overall_stats,
 )
 
+WRITE_BUFFER_SIZE = 1 << 20
+GAME_BATCHES_PER_WORKER = 4
+MIN_THREADED_FILE_WRITES = 16
+FILE_WRITE_THREADS = 8
+WRITE_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+# Pairings play at least this many games before they can be stopped early
+EARLY_STOP_MIN_GAMES = 10
 
-@dataclass
-class GameResultStat:
-    white_wins: int = 0
-    white_draws: int = 0
-    white_losses: int = 0
 
-    black_wins: int = 0
-    black_draws: int = 0
-    black_losses: int = 0
+def _init_game_worker() -> None:
+    # Forked workers inherit the parent's RNG state, so without a reseed every
+    # worker would feed its bots the exact same sequence of "random" moves.
+    random.seed()
+
+
+def _run_game(game: Game) -> GameResult:
+    # Top level so it can be pickled and sent to worker processes.
+    # Games sent in the same batch are unpickled together and so share their bot
+    # objects, play each one on its own copy so no bot state leaks between them.
+    game.white, game.black = copy.deepcopy((game.white, game.black))
+    return game.run()
+
+
+def _write_file(folder: str, dir_fd: Optional[int], name: str, content: str) -> None:
+    if dir_fd is not None:
+        # Open relative to the already open results folder, skipping path resolution
+        fd = os.open(name, WRITE_FILE_FLAGS, 0o644, dir_fd=dir_fd)
+    else:
+        fd = os.open(os.path.join(folder, name), WRITE_FILE_FLAGS, 0o644)
+    with os.fdopen(fd, "w", encoding="utf-8") as file:
+        file.write(content)
 
 
 class Controller:
@@ -65,10 +91,11 @@ class Controller:
         verbose: bool,
         output_dir: str,
         export_pdn: bool,
+        parallelism: int = 1,
+        elo_margin: Optional[float] = None,
     ):
         self.mode = mode
 
-        # NOTE: size currently not used
         self.size = size
         self.board_start_builder: BoardStartBuilder = self._get_board_start_builder(
             board_start_builder
@@ -83,6 +110,9 @@ class Controller:
         self.verbose = verbose
         self.output_dir = output_dir
         self.export_pdn = export_pdn
+        self.parallelism = parallelism
+        # None plays every scheduled game
+        self.elo_margin = elo_margin
 
         # Inits for non-params
         # List of rounds, each round being a list of games
@@ -90,6 +120,8 @@ class Controller:
         self.game_results: list[list[GameResult]] = [[] for _ in range(rounds)]
         self.game_id_counter: int = 0
         self.game_results_folder: Optional[str] = None
+        # (bot, opponent, round after which they stopped playing each other)
+        self.stopped_pairings: list[tuple[BotTracker, BotTracker, int]] = []
 
         self._init_game_schedule()
 
@@ -153,10 +185,8 @@ class Controller:
         Schedules all bots against each other, where each pairing plays as both sides in each round
         """
         for rnd in range(self.rounds):
-            for id1, bot1 in enumerate(self.bot_list):
-                for id2, bot2 in enumerate(self.bot_list):
-                    if id1 < id2:
-                        self._schedule_pair_game(bot1, bot2, rnd)
+            for bot1, bot2 in combinations(self.bot_list, 2):
+                self._schedule_pair_game(bot1, bot2, rnd)
 
     def _init_one_schedule(self, hero_bot: BotTracker) -> None:
         """
@@ -170,7 +200,7 @@ class Controller:
         new_game1 = Game(
             bot1,
             bot2,
-            Board(self.board_start_builder),
+            Board(self.board_start_builder, self.size),
             self._get_new_game_id(),
             rnd,
             self.verbose,
@@ -179,7 +209,7 @@ class Controller:
         new_game2 = Game(
             bot2,
             bot1,
-            Board(self.board_start_builder),
+            Board(self.board_start_builder, self.size),
             self._get_new_game_id(),
             rnd,
             self.verbose,
@@ -215,6 +245,15 @@ class Controller:
 
     def run(self) -> None:
         self._create_timestamped_folder()
+        if self.parallelism > 1:
+            with ProcessPoolExecutor(
+                max_workers=self.parallelism, initializer=_init_game_worker
+            ) as executor:
+                self._run_rounds(executor)
+        else:
+            self._run_rounds(None)
+
+    def _run_rounds(self, executor: Optional[ProcessPoolExecutor]) -> None:
         for rnd in range(self.rounds):
             for game in self.games[rnd]:
                 ev_white = game.white.calculate_ev(game.black)
@@ -225,9 +264,21 @@ class Controller:
                 game.white.register_ev(ev_white)
                 game.black.register_ev(ev_black)
 
-            for game in self.games[rnd]:
-                game_result = game.run()
-                self.game_results[rnd].append(game_result)
+            # Games within a round are independent (ratings only change at the end of
+            # a round), so they can be played in any order, or all at once.
+            if executor is not None:
+                # Send games to workers in batches, a few per worker, to cut down on
+                # pickling round trips without leaving workers idle at the end
+                chunksize = max(
+                    1, len(self.games[rnd]) // (self.parallelism * GAME_BATCHES_PER_WORKER)
+                )
+                self.game_results[rnd].extend(
+                    executor.map(_run_game, self.games[rnd], chunksize=chunksize)
+                )
+            else:
+                for game in self.games[rnd]:
+                    game_result = game.run()
+                    self.game_results[rnd].append(game_result)
 
             self._write_game_results(self.game_results[rnd])
 
@@ -239,6 +290,9 @@ class Controller:
             for bot in self.bot_list:
                 bot.update_rating()
 
+            if self.elo_margin is not None and rnd < self.rounds - 1:
+                self._stop_decided_pairings(rnd, self.elo_margin)
+
             if self.verbose:
                 print(f"Round {rnd} completed")
 
@@ -246,36 +300,112 @@ class Controller:
             print("Tournament completed, writing stats")
         self._write_tournament_results()
 
-    def _write_game_result_summary(self, file: IO, game_result: GameResult) -> None:
-        file.write(str(game_result))
-        file.write("\n" + "=" * 40 + "\n")
+    def _stop_decided_pairings(self, rnd: int, elo_margin: float) -> None:
+        """
+        Drops the remaining games of any pairing where one bot is confidently more than
+        elo_margin stronger than the other, since playing out such a lopsided pairing
+        adds little information. Close pairings keep playing every round.
+        """
+        # Pairings keyed regardless of colour, with the bots in the order first seen
+        decided: dict[frozenset[str], tuple[BotTracker, BotTracker]] = {}
+        for game in self.games[rnd]:
+            pairing = frozenset((game.white.unique_name, game.black.unique_name))
+            if pairing in decided:
+                continue
+
+            stat = game.white.h2h_stats[game.black.unique_name]
+            if stat.total_games < EARLY_STOP_MIN_GAMES:
+                continue
+
+            elo_low, elo_high = compute_elo_interval(
+                stat.total_wins, stat.total_draws, stat.total_losses
+            )
+            if elo_low > elo_margin or elo_high < -elo_margin:
+                decided[pairing] = (game.white, game.black)
+
+        # Only report pairings that actually had games left to drop
+        stopped: set[frozenset[str]] = set()
+        for later_rnd in range(rnd + 1, self.rounds):
+            remaining: list[Game] = []
+            for game in self.games[later_rnd]:
+                pairing = frozenset((game.white.unique_name, game.black.unique_name))
+                if pairing in decided:
+                    stopped.add(pairing)
+                else:
+                    remaining.append(game)
+            self.games[later_rnd] = remaining
+
+        for pairing, (bot1, bot2) in decided.items():
+            if pairing not in stopped:
+                continue
+            self.stopped_pairings.append((bot1, bot2, rnd))
+            if self.verbose:
+                print(
+                    f"{bot1.unique_name} vs {bot2.unique_name} decided after round {rnd}, stopping"
+                )
+
+    def _write_game_result_summary(self, out: list[str], game_result: GameResult) -> None:
+        out.append(f"{game_result}\n{'=' * 40}\n")
 
     def _write_game_results(self, game_results: list[GameResult]) -> None:
         assert self.game_results_folder is not None
+        # Build each file's content in memory and write it in one go, rather than
+        # issuing lots of tiny writes per game
+        summary: list[str] = []
+        # (file name within the results folder, content)
+        game_files: list[tuple[str, str]] = []
+        for game_result in game_results:
+            self._write_game_result_summary(summary, game_result)
+            if game_result.moves:
+                moves: list[str] = []
+                self._write_game_result_summary(moves, game_result)
+                moves.append("Moves: \n")
+                moves.append(game_result.moves)
+                game_files.append((f"game_{game_result.game_id}.txt", "".join(moves)))
+
+            if self.export_pdn:
+                game_files.append((f"game_{game_result.game_id}.pdn", game_result.moves_pdn))
+
+        # Per-game files are independent, so overlap their open/write/close calls
+        # when there are enough of them to be worth it
+        folder = self.game_results_folder
+        dir_fd = (
+            os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+            if game_files and os.open in os.supports_dir_fd
+            else None
+        )
+        try:
+            if len(game_files) >= MIN_THREADED_FILE_WRITES:
+                with ThreadPoolExecutor(max_workers=FILE_WRITE_THREADS) as executor:
+                    futures = [
+                        executor.submit(_write_file, folder, dir_fd, name, content)
+                        for name, content in game_files
+                    ]
+                    for future in futures:
+                        # Re-raises any error from the write
+                        future.result()
+            else:
+                for name, content in game_files:
+                    _write_file(folder, dir_fd, name, content)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
         game_result_summary_path = os.path.join(self.game_results_folder, "game_result_summary.txt")
-        with open(game_result_summary_path, "a", encoding="utf-8") as file:
-            for game_result in game_results:
-                self._write_game_result_summary(file, game_result)
-                if game_result.moves:
-                    game_result_moves_path = os.path.join(
-                        self.game_results_folder, f"game_{game_result.game_id}.txt"
-                    )
-                    with open(game_result_moves_path, "w", encoding="utf-8") as moves_file:
-                        self._write_game_result_summary(moves_file, game_result)
-                        moves_file.write("Moves: \n")
-                        moves_file.write(game_result.moves)
-
-                if self.export_pdn:
-                    game_result_pdn_path = os.path.join(
-                        self.game_results_folder, f"game_{game_result}.pdn"
-                    )
-                    with open(game_result_pdn_path, "w") as pdn_file:
-                        pdn_file.write(game_result.moves_pdn)
+        with open(
+            game_result_summary_path, "a", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+        ) as file:
+            file.write("".join(summary))
 
     def _write_tournament_results(self) -> None:
         assert self.game_results_folder is not None
         game_result_stats_path = os.path.join(self.game_results_folder, "game_result_stats.txt")
 
+        buffer = io.StringIO()
+        write_tournament_overall_stats(self.bot_list, buffer)
+        write_tournament_h2h_stats(self.bot_list, buffer)
+        if self.stopped_pairings:
+            write_early_stopped_pairings(self.stopped_pairings, buffer)
+
         with open(game_result_stats_path, "w", encoding="utf-8") as file:
-            write_tournament_overall_stats(self.bot_list, file)
-            write_tournament_h2h_stats(self.bot_list, file)
+            file.write(buffer.getvalue())
@@ -1,4 +1,5 @@
-import copy
+import re
+from functools import cache
 from typing import Optional, Tuple, overload
 
 from checkers_bot_tournament.board import Board
@@ -9,6 +10,28 @@ from checkers_bot_tournament.move import Move
 from checkers_bot_tournament.piece import Colour
 
 AUTO_DRAW_MOVECOUNT = 50 * 2
+PDN_MOVE_RE = re.compile(r"(\d+)([-x])(\d+)")
+
+
+@cache
+def _pdn_coordinates(size: int) -> list[Tuple[int, int]]:
+    """(row, col) of each PDN square number, indexed from 1 (index 0 is unused)."""
+    half = size // 2
+    coordinates = [(-1, -1)]
+    for square_num in range(1, half * size + 1):
+        row = (square_num - 1) // half
+        col = ((square_num - 1) % half) * 2 + (1 if row % 2 == 0 else 0)
+        coordinates.append((row, col))
+    return coordinates
+
+
+@cache
+def _coordinate_pdns(size: int) -> dict[Tuple[int, int], str]:
+    """PDN square number of every (row, col) on the board."""
+    half = size // 2
+    return {
+        (row, col): str(row * half + (col // 2) + 1) for row in range(size) for col in range(size)
+    }
 
 
 class Game:
@@ -44,7 +67,8 @@ class Game:
         self.black_num_captures = 0
 
         self.game_result: Optional[GameResult] = None
-        self.moves_string = ""  # if verbose else None
+        # Only verbose games keep a move log, headless games skip building it entirely
+        self.moves_parts: Optional[list[str]] = [] if verbose else None
 
         if self.pdn:
             self.import_pdn(self.pdn)
@@ -59,16 +83,17 @@ class Game:
         moves = pdn_content.split()  # Assumes moves are space-separated
 
         for move in moves:
-            if "-" in move:  # Regular move
-                start, end = move.split("-")
-            elif "x" in move:  # Capture move
-                start, end = move.split("x")
-            else:
+            match = PDN_MOVE_RE.fullmatch(move)
+            if match is None:
                 raise ValueError(f"Invalid move format: {move}")
+            # "-" for a regular move, "x" for a capture
+            start, separator, end = match.groups()
 
             start_pos = self._pdn_to_coordinates(start)
             end_pos = self._pdn_to_coordinates(end)
-            removed_pos = self._get_removed_position(start_pos, end_pos) if "x" in move else None
+            removed_pos = (
+                self._get_removed_position(start_pos, end_pos) if separator == "x" else None
+            )
 
             move_obj = Move(start_pos, end_pos, removed_pos)
 
@@ -123,16 +148,14 @@ class Game:
     def _pdn_to_coordinates(self, pdn: str) -> Tuple[int, int]:
         """Converts a PDN square number to a (row, col) coordinate."""
         square_num = int(pdn)
-        row = (square_num - 1) // (self.board.size // 2)
-        col = ((square_num - 1) % (self.board.size // 2)) * 2 + (1 if row % 2 == 0 else 0)
-
-        return row, col
+        pdn_coordinates = _pdn_coordinates(self.board.size)
+        if not 0 < square_num < len(pdn_coordinates):
+            raise ValueError(f"Invalid PDN square: {pdn}")
+        return pdn_coordinates[square_num]
 
     def _coordinates_to_pdn(self, coord: Tuple[int, int]) -> str:
         """Converts a (row, col) coordinate to a PDN square number."""
-        row, col = coord
-        square_num = row * (self.board.size // 2) + (col // 2) + 1
-        return str(square_num)
+        return _coordinate_pdns(self.board.size)[coord]
 
     def _get_removed_position(
         self, start: Tuple[int, int], end: Tuple[int, int]
@@ -145,11 +168,11 @@ class Game:
         return removed_row, removed_col
 
     def make_move(self) -> Optional[Result]:
-        bot = self.white.bot if self.current_turn == Colour.WHITE else self.black.bot
+        bot = self.white.bot if self.current_turn is Colour.WHITE else self.black.bot
         move_list: list[Move] = self.board.get_move_list(self.current_turn)
 
         if len(move_list) == 0:
-            result = Result.BLACK if self.current_turn == Colour.WHITE else Result.WHITE
+            result = Result.BLACK if self.current_turn is Colour.WHITE else Result.WHITE
             # TODO: You can add extra information here (and pass it into write_game_result)
             # and GameResult as needed
             # self.write_game_result(result)
@@ -163,7 +186,7 @@ class Game:
         #         return future.result(timeout=10)
         #     except TimeoutError:
         #         !!!
-        move_idx = bot.play_move(copy.deepcopy(self.board), self.current_turn, copy.copy(move_list))
+        move_idx = bot.play_move(self.board.clone(), self.current_turn, list(move_list))
         if move_idx < 0 or move_idx >= len(move_list):
             bot_string = make_unique_bot_string(bot.bot_id, bot.get_name())
             raise RuntimeError(f"bot: {bot_string} has played an invalid move")
@@ -178,18 +201,18 @@ class Game:
             if promotion:
                 self._record_promotion()
 
-        if self.verbose:
-            self.moves_string += f"Move {self.move_number}: {self.current_turn}'s turn\n"
-            self.moves_string += f"Moved from {str(move.start)} to {str(move.end)}\n"
-            self.moves_string += "\n" + self.board.display()
+        if self.moves_parts is not None:
+            self.moves_parts.append(f"Move {self.move_number}: {self.current_turn}'s turn\n")
+            self.moves_parts.append(f"Moved from {str(move.start)} to {str(move.end)}\n")
+            self.moves_parts.append("\n" + self.board.display())
 
         if self.move_number - self.last_action_move >= AUTO_DRAW_MOVECOUNT:
             result = Result.DRAW
             # TODO: You can add extra information here (and pass it into write_game_result)
             # and GameResult as needed
 
-            if self.verbose:
-                self.moves_string += f"Automatic draw by {AUTO_DRAW_MOVECOUNT/2}-move rule!\n"
+            if self.moves_parts is not None:
+                self.moves_parts.append(f"Automatic draw by {AUTO_DRAW_MOVECOUNT/2}-move rule!\n")
             # self.write_game_result(result)
             return result
 
@@ -197,18 +220,20 @@ class Game:
         return None
 
     def _record_capture(self) -> None:
-        if self.current_turn == Colour.WHITE:
+        if self.current_turn is Colour.WHITE:
             self.white_num_captures += 1
         else:
             self.black_num_captures += 1
 
     def _record_promotion(self) -> None:
-        if self.current_turn == Colour.WHITE:
+        if self.current_turn is Colour.WHITE:
             self.white_kings_made += 1
         else:
             self.black_kings_made += 1
 
     def run(self) -> GameResult:
+        self.white.bot.reset()
+        self.black.bot.reset()
         while True:
             # TODO: Implement chain moves (use is_first_move)
             result = self.make_move()
@@ -224,16 +249,16 @@ class Game:
             game_id=self.game_id,
             game_round=self.game_round,
             result=result,
-            white_name=make_unique_bot_string(self.white),
+            white_name=self.white.unique_name,
             white_rating=round(self.white.rating),
             white_kings_made=self.white_kings_made,
             white_num_captures=self.white_num_captures,
-            black_name=make_unique_bot_string(self.black),
+            black_name=self.black.unique_name,
             black_rating=round(self.black.rating),
             black_kings_made=self.black_kings_made,
             black_num_captures=self.black_num_captures,
             num_moves=self.move_number,
-            moves=self.moves_string,
+            moves="".join(self.moves_parts) if self.moves_parts is not None else "",
             moves_pdn=self.export_pdn(),
         )
         return self.game_result
@@ -10,7 +10,7 @@ class Result(Enum):
     DRAW = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class GameResult:
     game_id: int
     game_round: int
@@ -1,4 +1,5 @@
 import argparse
+import os
 
 from checkers_bot_tournament.controller import Controller
 
@@ -54,6 +55,29 @@ def main():
         help="Directory to save output files (default: .).",
     )
 
+    # Parallelism
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of games to play in parallel (default: number of CPUs).",
+    )
+
+    # Early stopping
+    parser.add_argument(
+        "--elo-margin",
+        type=float,
+        default=200.0,
+        help="Stop scheduling a pairing once one bot is confidently more than this many "
+        "Elo points stronger than the other (default: 200).",
+    )
+
+    parser.add_argument(
+        "--no-early-stop",
+        action="store_true",
+        help="Play every scheduled game, ignoring --elo-margin.",
+    )
+
     args = parser.parse_args()
 
     # Validation: Ensure either `bot` or `bot_list` is provided
@@ -65,6 +89,12 @@ def main():
     if args.rounds < 1:
         parser.error("rounds is required to be an integer >= 1")
 
+    if args.parallelism < 1:
+        parser.error("parallelism is required to be an integer >= 1")
+
+    if args.elo_margin < 0:
+        parser.error("elo-margin is required to be >= 0")
+
     # Create the controller
     controller = Controller(
         mode=args.mode,
@@ -77,5 +107,7 @@ def main():
         verbose=args.verbose,
         output_dir=args.output_dir,
         export_pdn=args.export_pdn,
+        parallelism=args.parallelism,
+        elo_margin=None if args.no_early_stop else args.elo_margin,
     )
     controller.run()
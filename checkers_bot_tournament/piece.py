@@ -7,9 +7,9 @@ class Colour(Enum):
     BLACK = auto()
 
     def get_opposite(self) -> "Colour":
-        if self == Colour.WHITE:
+        if self is Colour.WHITE:
             return Colour.BLACK
-        elif self == Colour.BLACK:
+        elif self is Colour.BLACK:
             return Colour.WHITE
 
 
@@ -2,7 +2,11 @@ from math import inf
 from typing import IO
 
 from checkers_bot_tournament.bots.bot_tracker import BotTracker
-from checkers_bot_tournament.checkers_util import compute_performance_rating, make_unique_bot_string
+from checkers_bot_tournament.checkers_util import (
+    compute_elo_interval,
+    compute_performance_rating,
+    make_unique_bot_string,
+)
 
 
 def write_tournament_overall_stats(bot_list: list[BotTracker], file: IO) -> None:
@@ -208,3 +212,28 @@ def write_tournament_h2h_stats(bot_list: list[BotTracker], file: IO) -> None:
         file.write(line2 + "\n" * 2)
 
     file.write("=" * 100 + "\n\n")
+
+
+def write_early_stopped_pairings(
+    stopped_pairings: list[tuple[BotTracker, BotTracker, int]], file: IO
+) -> None:
+    """
+    Lists the pairings that stopped being scheduled before the last round because
+    the 95% confidence interval of their Elo difference lay entirely beyond the
+    requested Elo margin, i.e. one bot was already clearly the stronger one.
+    """
+    file.write("Early Stopped Pairings\n")
+    file.write("=" * 60 + "\n\n")
+
+    for bot1, bot2, rnd in stopped_pairings:
+        stat = bot1.h2h_stats[bot2.unique_name]
+        elo_low, elo_high = compute_elo_interval(
+            stat.total_wins, stat.total_draws, stat.total_losses
+        )
+        file.write(
+            f"{bot1.unique_name} vs {bot2.unique_name}: stopped after round {rnd}, "
+            f"{stat.total_wins}/{stat.total_draws}/{stat.total_losses} "
+            f"in {stat.total_games} games, Δ {round(elo_low)} to {round(elo_high)}\n"
+        )
+
+    file.write("\n" + "=" * 60 + "\n\n")
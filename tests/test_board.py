@@ -0,0 +1,103 @@
+import pytest
+
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.board_start_builder import DefaultBSB
+from checkers_bot_tournament.move import Move
+from checkers_bot_tournament.piece import Colour
+
+
+def test_clone_is_independent():
+    board = Board(DefaultBSB())
+    board.move_piece(Move((5, 2), (4, 1), None))
+
+    clone = board.clone()
+    assert clone.display() == board.display()
+    assert clone.get_move_history() == board.get_move_history()
+
+    clone.move_piece(Move((2, 1), (3, 0), None))
+    clone_piece = clone.get_piece((3, 0))
+    assert clone_piece is not None
+    clone_piece.is_king = True
+
+    assert board.get_piece((3, 0)) is None
+    assert board.get_piece((2, 1)) is not None
+    assert len(board.get_move_history()) == 1
+    assert clone.display() != board.display()
+
+
+def test_move_list_refreshed_after_move():
+    board = Board(DefaultBSB())
+    white_moves = board.get_move_list(Colour.WHITE)
+    assert board.get_move_list(Colour.WHITE) == white_moves
+
+    board.move_piece(Move((5, 2), (4, 1), None))
+    assert board.get_move_list(Colour.WHITE) != white_moves
+    assert Move((4, 1), (3, 0), None) in board.get_move_list(Colour.WHITE)
+
+
+def test_clone_history_unaffected_by_later_moves():
+    board = Board(DefaultBSB())
+    board.move_piece(Move((5, 2), (4, 1), None))
+    clone = board.clone()
+
+    board.move_piece(Move((2, 1), (3, 0), None))
+    assert clone.get_move_history() == (Move((5, 2), (4, 1), None),)
+
+    clone.move_piece(Move((2, 3), (3, 4), None))
+    assert clone.get_move_history()[-1] == Move((2, 3), (3, 4), None)
+    assert board.get_move_history()[-1] == Move((2, 1), (3, 0), None)
+    assert len(board.get_move_history()) == len(clone.get_move_history()) == 2
+
+
+def test_move_list_on_larger_board():
+    board = Board(DefaultBSB(10), 10)
+    white_moves = board.get_move_list(Colour.WHITE)
+    black_moves = board.get_move_list(Colour.BLACK)
+
+    # Only the front row of each side can move, each piece has two moves bar one at the edge
+    assert len(white_moves) == len(black_moves) == 9
+    assert all(move.start[0] == 6 for move in white_moves)
+    assert all(move.start[0] == 3 for move in black_moves)
+
+
+def test_move_list_changes_do_not_leak_into_cache():
+    board = Board(DefaultBSB())
+    expected = board.get_move_list(Colour.WHITE)
+
+    board.get_move_list(Colour.WHITE).pop()
+    clone = board.clone()
+    clone.get_move_list(Colour.WHITE).sort(key=lambda move: move.end, reverse=True)
+    clone.get_move_list(Colour.WHITE).clear()
+
+    assert board.get_move_list(Colour.WHITE) == expected
+    assert clone.get_move_list(Colour.WHITE) == expected
+
+
+def test_move_history_is_read_only():
+    board = Board(DefaultBSB())
+    board.move_piece(Move((5, 2), (4, 1), None))
+    board.move_piece(Move((2, 1), (3, 0), None))
+    clone = board.clone()
+
+    with pytest.raises(AttributeError):
+        clone.get_move_history().reverse()  # type: ignore[attr-defined]
+
+    assert board.get_move_history() == (Move((5, 2), (4, 1), None), Move((2, 1), (3, 0), None))
+
+
+def test_move_history_view_is_a_snapshot():
+    board = Board(DefaultBSB())
+    first, second = Move((5, 2), (4, 1), None), Move((2, 1), (3, 0), None)
+    board.move_piece(first)
+    history = board.get_move_history()
+
+    board.move_piece(second)
+    assert len(history) == 1
+    assert list(history) == [first]
+    with pytest.raises(IndexError):
+        history[1]
+
+    history = board.get_move_history()
+    assert history[-2] == history[0] == first
+    assert history[1:] == (second,)
+    assert history == [first, second]
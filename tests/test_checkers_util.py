@@ -0,0 +1,18 @@
+from checkers_bot_tournament.checkers_util import compute_elo_interval
+
+
+def test_elo_interval_even_score_is_symmetric():
+    low, high = compute_elo_interval(5, 0, 5)
+    assert low < 0 < high
+    assert abs(low + high) < 1e-9
+
+
+def test_elo_interval_narrows_with_more_games():
+    low_few, high_few = compute_elo_interval(5, 0, 5)
+    low_many, high_many = compute_elo_interval(50, 0, 50)
+    assert high_many - low_many < high_few - low_few
+
+
+def test_elo_interval_clamped_for_perfect_score():
+    low, high = compute_elo_interval(10, 0, 0)
+    assert 0 < low < high == 800
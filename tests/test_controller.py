@@ -0,0 +1,166 @@
+import pickle
+from pathlib import Path
+from typing import Optional
+
+from checkers_bot_tournament.bots.bot_tracker import BotTracker
+from checkers_bot_tournament.bots.first_mover import FirstMover
+from checkers_bot_tournament.controller import EARLY_STOP_MIN_GAMES, Controller, _run_game
+
+
+class ResetCounter(FirstMover):
+    def __init__(self, bot_id: int) -> None:
+        super().__init__(bot_id)
+        self.resets = 0
+
+    def reset(self) -> None:
+        self.resets += 1
+
+    def get_name(self) -> str:
+        return "ResetCounter"
+
+
+def make_controller(
+    output_dir: Path,
+    bot_names: Optional[list[str]] = None,
+    size: int = 8,
+    rounds: int = 1,
+    export_pdn: bool = False,
+    elo_margin: Optional[float] = None,
+    parallelism: int = 1,
+) -> Controller:
+    return Controller(
+        mode="all",
+        board_start_builder="default",
+        pdn=None,
+        bot_name=None,
+        bot_names=bot_names or ["FirstMover", "RandomBot"],
+        size=size,
+        rounds=rounds,
+        verbose=False,
+        output_dir=str(output_dir),
+        export_pdn=export_pdn,
+        parallelism=parallelism,
+        elo_margin=elo_margin,
+    )
+
+
+def test_export_pdn_names_files_by_game_id(tmp_path):
+    controller = make_controller(tmp_path, export_pdn=True)
+    controller.run()
+
+    assert controller.game_results_folder is not None
+    results_folder = Path(controller.game_results_folder)
+    pdn_files = sorted(path.name for path in results_folder.glob("*.pdn"))
+    assert pdn_files == ["game_1.pdn", "game_2.pdn"]
+
+    for game_result in controller.game_results[0]:
+        pdn_path = results_folder / f"game_{game_result.game_id}.pdn"
+        assert pdn_path.read_text() == game_result.moves_pdn
+
+
+def test_runs_on_non_default_board_size(tmp_path):
+    controller = make_controller(tmp_path, size=10)
+    controller.run()
+
+    assert len(controller.game_results[0]) == 2
+    for game in controller.games[0]:
+        assert game.board.size == 10
+
+
+def test_parallel_run_matches_sequential_run(tmp_path):
+    # Deterministic bots, so both runs should play out exactly the same games
+    bot_names = ["FirstMover", "ScaredyCat", "GreedyCat"]
+    summaries = []
+    game_results = []
+    for parallelism in (1, 2):
+        controller = make_controller(
+            tmp_path / str(parallelism), bot_names=bot_names, rounds=2, parallelism=parallelism
+        )
+        controller.run()
+
+        assert controller.game_results_folder is not None
+        summary_path = Path(controller.game_results_folder) / "game_result_summary.txt"
+        summaries.append(summary_path.read_text())
+        game_results.append(controller.game_results)
+
+    assert game_results[0] == game_results[1]
+    assert summaries[0] == summaries[1]
+
+
+def set_h2h_record(bot: BotTracker, opp: BotTracker, wins: int, draws: int, losses: int) -> None:
+    bot_stat = bot.h2h_stats[opp.unique_name]
+    bot_stat.white_wins, bot_stat.white_draws, bot_stat.white_losses = wins, draws, losses
+    opp_stat = opp.h2h_stats[bot.unique_name]
+    opp_stat.white_wins, opp_stat.white_draws, opp_stat.white_losses = losses, draws, wins
+
+
+def test_lopsided_pairings_stop_before_even_ones(tmp_path):
+    controller = make_controller(
+        tmp_path, bot_names=["FirstMover", "RandomBot", "ScaredyCat", "CopyCat"], rounds=3
+    )
+    bot1, bot2, bot3, bot4 = controller.bot_list
+    set_h2h_record(bot1, bot2, 0, 0, 14)  # shutout
+    set_h2h_record(bot3, bot4, 100, 0, 100)  # even, with far more games played
+    set_h2h_record(bot1, bot3, 60, 0, 40)  # favoured, but not by much
+
+    controller._stop_decided_pairings(0, 200)
+
+    stopped = {
+        frozenset((bot.unique_name, opp.unique_name)) for bot, opp, _ in controller.stopped_pairings
+    }
+    assert stopped == {frozenset((bot1.unique_name, bot2.unique_name))}
+    for game in controller.games[1] + controller.games[2]:
+        assert {game.white, game.black} != {bot1, bot2}
+    assert len(controller.games[1]) == len(controller.games[2]) == 10
+
+
+def test_stopped_pairings_only_lists_pairings_with_games_dropped(tmp_path):
+    # ScaredyCat wins every game against FirstMover, so the pairing is decided as
+    # soon as it reaches the minimum game count
+    rounds_to_decide = EARLY_STOP_MIN_GAMES // 2
+
+    controller = make_controller(
+        tmp_path / "exact",
+        bot_names=["ScaredyCat", "FirstMover"],
+        rounds=rounds_to_decide,
+        elo_margin=0,
+    )
+    controller.run()
+    assert controller.stopped_pairings == []
+    assert all(len(results) == 2 for results in controller.game_results)
+
+    controller = make_controller(
+        tmp_path / "extra",
+        bot_names=["ScaredyCat", "FirstMover"],
+        rounds=rounds_to_decide + 1,
+        elo_margin=0,
+    )
+    controller.run()
+    bot1, bot2 = controller.bot_list
+    assert controller.stopped_pairings == [(bot1, bot2, rounds_to_decide - 1)]
+    assert controller.game_results[-1] == []
+
+
+def test_sequential_games_reuse_bot_instance(tmp_path, monkeypatch):
+    monkeypatch.setitem(Controller.bot_mapping, "ResetCounter", ResetCounter)
+    controller = make_controller(tmp_path, bot_names=["ResetCounter", "FirstMover"], rounds=2)
+    controller.run()
+
+    bot = controller.bot_list[0].bot
+    assert isinstance(bot, ResetCounter)
+    assert bot.resets == 4
+
+
+def test_parallel_games_each_get_their_own_bot_copy(tmp_path, monkeypatch):
+    monkeypatch.setitem(Controller.bot_mapping, "ResetCounter", ResetCounter)
+    controller = make_controller(tmp_path, bot_names=["ResetCounter", "FirstMover"])
+
+    # Games sent to a worker in one batch are unpickled together, sharing their bots
+    games = pickle.loads(pickle.dumps(controller.games[0]))
+    for game in games:
+        _run_game(game)
+
+    for game in games:
+        bot = game.white.bot if isinstance(game.white.bot, ResetCounter) else game.black.bot
+        assert isinstance(bot, ResetCounter)
+        assert bot.resets == 1
@@ -98,3 +98,12 @@ def test_import_export_consistency(temp_pdn_file, sample_pdn):
     exported_pdn = export_file_path.read_text().strip()
 
     assert exported_pdn == sample_pdn
+
+
+@pytest.mark.parametrize("bad_move", ["22/17", "22-17-13", "a-17"])
+def test_import_pdn_rejects_malformed_moves(temp_pdn_file, bad_move):
+    """Test that tokens which aren't a single move are rejected."""
+    temp_pdn_file.write_text(f"22-17 {bad_move}")
+
+    with pytest.raises(ValueError):
+        Game(Bot(0), Bot(0), Board(DefaultBSB()), 0, 0, False, temp_pdn_file)